@@ -1,17 +1,24 @@
 import smtplib
+import socket
 from email.message import EmailMessage
 
 ADMIN_MAIL = ""
 STUDENT_MAIL = ""
 PASSCODE_MAIL= "" #ovcfymyouzevkgtz
 
+class NoDelaySMTP_SSL(smtplib.SMTP_SSL):
+    def _get_socket(self, host, port, timeout):
+        sock = super()._get_socket(host, port, timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
 msg = EmailMessage()
 msg['Subject'] = "Test Email"
 msg['From'] = ADMIN_MAIL
 msg['To'] = STUDENT_MAIL
 msg.set_content("This is a test message from Python.")
 
-with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
+with NoDelaySMTP_SSL("smtp.gmail.com", 465) as server:
     server.login(ADMIN_MAIL,PASSCODE_MAIL ) #ovcfymyouzevkgtz
     server.send_message(msg)
 